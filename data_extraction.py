@@ -5,6 +5,9 @@ raw data into pandas DataFrames ready for further processing.
 """
 
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from numbers import Integral, Number
+from sqlalchemy import column, func, literal_column, or_, select, table, text
 from sqlalchemy.exc import SQLAlchemyError
 from database_utils import DatabaseConnector
 import tabula
@@ -31,6 +34,124 @@ class DataExtractor:
             print(f"An error occurred while extracting data: {e}")
             return None
 
+    @staticmethod
+    def read_rds_table_parallel(db_connector, table_name, key_column='index', partitions=4, stream=False):
+        """
+        This method extracts a large RDS table over several pooled connections at once. It finds the
+        min/max of key_column (which must be numeric, otherwise a ValueError is raised), splits that range
+        into the given number of partitions and reads each one concurrently, all from one exported snapshot
+        so the pieces are consistent with each other. The partitions are combined into one DataFrame in key
+        order. With stream=True a generator is returned instead that yields each partition's DataFrame as
+        soon as it finishes; every partition is still read at once, so this does not lower peak memory use.
+        A database error prints a message and returns None, or ends the generator early when stream=True.
+        """
+        if partitions < 1:
+            raise ValueError("The number of partitions must be at least 1.")
+        if stream:
+            return DataExtractor._stream_rds_partitions(db_connector, table_name, key_column, partitions)
+        engine = DataExtractor._init_partition_engine(db_connector, partitions)
+        if engine is None:
+            return None
+        try:
+            frames = DataExtractor._read_rds_partitions(engine, table_name, key_column, partitions, in_key_order=True)
+            return pd.concat(list(frames), ignore_index=True)
+        except SQLAlchemyError as e:
+            print(f"An error occurred while extracting data: {e}")
+            return None
+        finally:
+            engine.dispose()
+
+    @staticmethod
+    def _init_partition_engine(db_connector, partitions):
+        """
+        Creates the pooled engine for a partitioned read. One extra connection in the pool holds the
+        transaction that exports the snapshot.
+        """
+        engine = db_connector._init_db_engine(pool_size=partitions + 1, max_overflow=0)
+        if engine is None:
+            print("An error occurred while extracting data: database engine is not initialised.")
+        return engine
+
+    @staticmethod
+    def _stream_rds_partitions(db_connector, table_name, key_column, partitions):
+        """
+        Generator used by read_rds_table_parallel when stream=True. The engine is only created once the
+        caller starts iterating, so an unused generator holds no connections. Database errors get the same
+        handling as the DataFrame path and the engine is disposed once the partitions are exhausted.
+        """
+        engine = DataExtractor._init_partition_engine(db_connector, partitions)
+        if engine is None:
+            return
+        try:
+            yield from DataExtractor._read_rds_partitions(engine, table_name, key_column, partitions, in_key_order=False)
+        except SQLAlchemyError as e:
+            print(f"An error occurred while extracting data: {e}")
+        finally:
+            engine.dispose()
+
+    @staticmethod
+    def _read_rds_partitions(engine, table_name, key_column, partitions, in_key_order):
+        """
+        Generator behind read_rds_table_parallel. The coordinating connection keeps its REPEATABLE READ
+        transaction open until every partition has been read, as the exported snapshot only lives that long.
+        Partitions are yielded in key order when in_key_order is True, otherwise in completion order.
+        """
+        snapshot_engine = engine.execution_options(isolation_level='REPEATABLE READ')
+        rds_table = table(table_name, column(key_column))
+        key = rds_table.c[key_column]
+        with snapshot_engine.connect() as coordinator:
+            with coordinator.begin():
+                snapshot_id = coordinator.execute(text("SELECT pg_export_snapshot()")).scalar()
+                low, high = coordinator.execute(select(func.min(key), func.max(key))).one()
+                queries = DataExtractor._partition_queries(rds_table, key, low, high, partitions)
+                with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+                    futures = [
+                        executor.submit(DataExtractor._read_rds_partition, snapshot_engine, snapshot_id, query)
+                        for query in queries
+                    ]
+                    for future in (futures if in_key_order else as_completed(futures)):
+                        yield future.result()
+
+    @staticmethod
+    def _partition_queries(rds_table, key, low, high, partitions):
+        """
+        Builds one SELECT per key range. The first range also picks up rows whose key is NULL so that
+        no rows are lost compared with reading the whole table.
+        """
+        # Ordering by the key (an index range scan on Postgres) keeps the combined frame in the same order every run
+        base_query = select(literal_column('*')).select_from(rds_table).order_by(key)
+        # An empty table, a single key value or a single partition leaves nothing to split
+        if low is None or low == high or partitions == 1:
+            return [base_query]
+        if not isinstance(low, Number) or not isinstance(high, Number):
+            raise ValueError(f"Key column '{key.name}' must be numeric to be split into partitions.")
+
+        if isinstance(low, Integral) and isinstance(high, Integral):
+            # Integer bounds keep the comparison bigint-to-bigint so Postgres can use the key's index
+            bounds = [low + (high - low) * i // partitions for i in range(1, partitions)]
+        else:
+            bounds = [low + (high - low) * i / partitions for i in range(1, partitions)]
+        # Narrow integer ranges can repeat a bound or floor it to the minimum, which would only add empty partitions
+        bounds = [bound for bound in dict.fromkeys(bounds) if bound > low]
+        if not bounds:
+            return [base_query]
+        queries = [base_query.where(or_(key < bounds[0], key.is_(None)))]
+        for lower, upper in zip(bounds, bounds[1:]):
+            queries.append(base_query.where(key >= lower, key < upper))
+        queries.append(base_query.where(key >= bounds[-1]))
+        return queries
+
+    @staticmethod
+    def _read_rds_partition(snapshot_engine, snapshot_id, query):
+        """
+        Reads a single key range inside a transaction that has imported the coordinator's snapshot.
+        """
+        with snapshot_engine.connect() as connection:
+            with connection.begin():
+                # SET TRANSACTION SNAPSHOT has to be the first statement of the transaction
+                connection.execute(text("SET TRANSACTION SNAPSHOT :snapshot_id"), {"snapshot_id": snapshot_id})
+                return pd.read_sql(query, connection)
+
     def retrieve_pdf_data(pdf_link):
         """
         This function uses the tabula library to extract table data from a given PDF document.
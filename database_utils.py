@@ -30,15 +30,17 @@ class DatabaseConnector:
             return None
     
     # This private method initialises a connection to the AWS RDS database and uses credentials to read from
-    # the YAML file and creates a SQLAlchemy engine.
-    def _init_db_engine(self):
+    # the YAML file and creates a SQLAlchemy engine. Any extra keyword arguments (e.g. pool_size) are passed
+    # straight through to create_engine so callers can size the connection pool for parallel reads.
+    def _init_db_engine(self, **engine_kwargs):
         try:
             creds = self._read_db_creds()
             if creds is None:
                 raise ValueError("Database credentials are not available.")
 
             db_conn_url = create_engine(
-                f"postgresql+psycopg2://{creds['RDS_USER']}:{creds['RDS_PASSWORD']}@{creds['RDS_HOST']}:{creds['RDS_PORT']}/{creds['RDS_DATABASE']}"
+                f"postgresql+psycopg2://{creds['RDS_USER']}:{creds['RDS_PASSWORD']}@{creds['RDS_HOST']}:{creds['RDS_PORT']}/{creds['RDS_DATABASE']}",
+                **engine_kwargs
             )
             return db_conn_url
         except SQLAlchemyError as e:
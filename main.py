@@ -18,8 +18,8 @@ def main():
         rds_table_name = 'legacy_users'
         local_table_name = 'dim_card_details'  # New local table for card details
 
-        # Extracting data from the remote RDS table and handle any failures in the process.
-        rds_dataframe = data_extractor.read_rds_table(db_connector, rds_table_name)
+        # Extracting data from the remote RDS table in parallel key ranges and handle any failures in the process.
+        rds_dataframe = data_extractor.read_rds_table_parallel(db_connector, rds_table_name, key_column='index')
         if rds_dataframe is None:
             raise ValueError(f"Failed to extract data from table: {rds_table_name}")
 
@@ -107,7 +107,7 @@ def main():
 
         # I extract order data from the RDS, clean it, and upload it to the local database.
         if orders_table_name:
-            orders_df = DataExtractor.read_rds_table(db_connector, orders_table_name)
+            orders_df = DataExtractor.read_rds_table_parallel(db_connector, orders_table_name, key_column='index')
             if orders_df.empty:
                 print("No data found in orders table")
             else: